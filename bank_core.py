@@ -0,0 +1,601 @@
+import json
+import os
+import secrets
+import sys
+from abc import ABC, abstractmethod
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors that mean the accounts file is missing or corrupt, for whichever parser is in use
+if ijson is None:
+    _LOAD_ERRORS = (FileNotFoundError, json.JSONDecodeError)
+else:
+    _LOAD_ERRORS = (FileNotFoundError, json.JSONDecodeError, ijson.JSONError)
+
+
+# ======== JSON Helpers ========
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # can keep catching the stdlib exception either way.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    # Write to a sibling temp file and swap it in, so a crash mid-write
+    # never leaves a truncated data file behind.
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# ======== Account Base Class ========
+class Account(ABC):
+    __slots__ = ('_account_number', '_account_holder_id', '_balance', '_details_cache', '_bank', '_row')
+
+    def __init__(self, account_number: str, account_holder_id: str, initial_balance: float = 0.0):
+        self._account_number = account_number
+        self._account_holder_id = account_holder_id
+        self._balance = initial_balance
+        self._details_cache = None
+        # Set by Bank._attach_account; from then on the balance lives in the bank's columns
+        self._bank = None
+        self._row = -1
+
+    @property
+    def account_number(self) -> str:
+        return self._account_number
+
+    @property
+    def balance(self) -> float:
+        if self._bank is None:
+            return self._balance
+        return float(self._bank._bal[self._row])
+
+    def _set_balance(self, value: float) -> None:
+        if self._bank is None:
+            self._balance = value
+        else:
+            self._bank._bal[self._row] = value
+
+    def _attach(self, bank, row: int) -> None:
+        self._bank = bank
+        self._row = row
+
+    def _detach(self) -> None:
+        # Take the values back from the bank's columns before they go away
+        if self._bank is not None:
+            self._balance = self.balance
+            self._bank = None
+            self._row = -1
+
+    @property
+    def account_holder_id(self) -> str:
+        return self._account_holder_id
+
+    @property
+    def type_tag(self) -> str:
+        return self._type_tag
+
+    @abstractmethod
+    def deposit(self, amount: float) -> bool:
+        pass
+
+    @abstractmethod
+    def withdraw(self, amount: float) -> bool:
+        pass
+
+    def display_details(self) -> str:
+        # Cached per balance, so changes made directly on the bank's columns are picked up;
+        # setters clear it when an account setting changes
+        balance = self.balance
+        cache = self._details_cache
+        if cache is None or cache[0] != balance:
+            cache = self._details_cache = (balance, self._format_details())
+        return cache[1]
+
+    def _format_details(self) -> str:
+        return f"Acc No: {self._account_number}, Balance: ${self.balance:.2f}"
+
+    def to_dict(self) -> dict:
+        return {
+            'account_number': self._account_number,
+            'account_holder_id': self._account_holder_id,
+            'balance': self.balance,
+            'type': 'account'
+        }
+
+
+# ======== SavingsAccount Class ========
+class SavingsAccount(Account):
+    __slots__ = ('_interest_rate',)
+    _type_tag = 'savings'
+
+    def __init__(self, account_number: str, account_holder_id: str,
+                 initial_balance: float = 0.0, interest_rate: float = 0.01):
+        super().__init__(account_number, account_holder_id, initial_balance)
+        self._interest_rate = interest_rate if interest_rate >= 0 else 0.01
+
+    @property
+    def interest_rate(self) -> float:
+        if self._bank is None:
+            return self._interest_rate
+        return float(self._bank._rate[self._row])
+
+    @interest_rate.setter
+    def interest_rate(self, value: float):
+        if value < 0:
+            raise ValueError("Interest rate cannot be negative.")
+        if self._bank is None:
+            self._interest_rate = value
+        else:
+            self._bank._rate[self._row] = value
+        self._details_cache = None
+
+    def _detach(self) -> None:
+        if self._bank is not None:
+            self._interest_rate = self.interest_rate
+        super()._detach()
+
+    def deposit(self, amount: float) -> bool:
+        if amount <= 0:
+            return False
+        self._set_balance(self.balance + amount)
+        return True
+
+    def withdraw(self, amount: float) -> bool:
+        balance = self.balance
+        if amount <= 0 or amount > balance:
+            return False
+        self._set_balance(balance - amount)
+        return True
+
+    def apply_interest(self) -> None:
+        balance = self.balance
+        self._set_balance(balance + balance * self.interest_rate)
+
+    def _format_details(self) -> str:
+        base = super()._format_details()
+        return f"{base}, Interest Rate: {self.interest_rate * 100:.2f}%"
+
+    def to_dict(self) -> dict:
+        d = super().to_dict()
+        d.update({
+            'interest_rate': self.interest_rate,
+            'type': 'savings'
+        })
+        return d
+
+
+# ======== CheckingAccount Class ========
+class CheckingAccount(Account):
+    __slots__ = ('_overdraft_limit',)
+    _type_tag = 'checking'
+
+    def __init__(self, account_number: str, account_holder_id: str,
+                 initial_balance: float = 0.0, overdraft_limit: float = 0.0):
+        super().__init__(account_number, account_holder_id, initial_balance)
+        self._overdraft_limit = overdraft_limit if overdraft_limit >= 0 else 0.0
+
+    @property
+    def overdraft_limit(self) -> float:
+        return self._overdraft_limit
+
+    @overdraft_limit.setter
+    def overdraft_limit(self, value: float):
+        if value < 0:
+            raise ValueError("Overdraft limit cannot be negative.")
+        self._overdraft_limit = value
+        self._details_cache = None
+
+    def deposit(self, amount: float) -> bool:
+        if amount <= 0:
+            return False
+        self._set_balance(self.balance + amount)
+        return True
+
+    def withdraw(self, amount: float) -> bool:
+        if amount <= 0:
+            return False
+        balance = self.balance
+        if (balance - amount) < -self._overdraft_limit:
+            return False
+        self._set_balance(balance - amount)
+        return True
+
+    def _format_details(self) -> str:
+        base = super()._format_details()
+        return f"{base}, Overdraft Limit: ${self._overdraft_limit:.2f}"
+
+    def to_dict(self) -> dict:
+        d = super().to_dict()
+        d.update({
+            'overdraft_limit': self._overdraft_limit,
+            'type': 'checking'
+        })
+        return d
+# ======== Customer Class ========
+class Customer:
+    __slots__ = ('_customer_id', '_name', '_address', '_account_numbers')
+
+    def __init__(self, customer_id: str, name: str, address: str):
+        self._customer_id = customer_id
+        self._name = name
+        self._address = address
+        self._account_numbers = set()
+
+    @property
+    def customer_id(self) -> str:
+        return self._customer_id
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    @address.setter
+    def address(self, value: str):
+        self._address = value
+
+    @property
+    def account_numbers(self) -> set:
+        # Returned without copying; use add_account_number/remove_account_number to change it
+        return self._account_numbers
+
+    @property
+    def account_count(self) -> int:
+        return len(self._account_numbers)
+
+    def add_account_number(self, account_number: str) -> None:
+        self._account_numbers.add(account_number)
+
+    def remove_account_number(self, account_number: str) -> None:
+        self._account_numbers.discard(account_number)
+
+    def retain_account_numbers(self, valid) -> None:
+        """Drop every account number not in valid"""
+        self._account_numbers.intersection_update(valid)
+
+    def display_details(self) -> str:
+        return (f"Customer ID: {self._customer_id}, Name: {self._name}, Address: {self._address}, "
+                f"Accounts: {len(self._account_numbers)}")
+
+    def to_dict(self) -> dict:
+        return {
+            'customer_id': self._customer_id,
+            'name': self._name,
+            'address': self._address,
+            'account_numbers': sorted(self._account_numbers)
+        }
+
+
+# ======== Bank Class ========
+# Account type tag -> int8 code stored in the Bank's type column
+_TYPE_CODES = {'savings': 1, 'checking': 2}
+
+
+def _grow_column(column, capacity: int):
+    grown = np.zeros(capacity, dtype=column.dtype)
+    grown[:len(column)] = column
+    return grown
+
+
+class Bank:
+    SAVE_DELAY_MS = 250
+    COLUMN_CAPACITY = 64
+    STREAM_LOAD_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, customer_file='customers.json', account_file='accounts.json', scheduler=None):
+        self._customers = {}
+        self._accounts = {}
+        self._savings_accounts = set()
+        self._customer_file = customer_file
+        self._account_file = account_file
+        # scheduler(delay_ms, callback) defers writes (e.g. Tk's root.after);
+        # without one, every mutation is written through immediately.
+        self._scheduler = scheduler
+        self._dirty_customers = False
+        self._dirty_accounts = False
+        self._save_scheduled = False
+        self._reset_columns()
+        self._load_data()
+
+    def _reset_columns(self) -> None:
+        # Columnar account store: one row per attached account, holding its balance,
+        # interest rate and type, plus the account number -> row index. NumPy arrays
+        # with spare capacity when available, plain lists otherwise.
+        self._row = {}
+        self._size = 0
+        if np is None:
+            self._bal = []
+            self._rate = []
+            self._type = []
+        else:
+            self._bal = np.zeros(self.COLUMN_CAPACITY, dtype=np.float64)
+            self._rate = np.zeros(self.COLUMN_CAPACITY, dtype=np.float64)
+            self._type = np.zeros(self.COLUMN_CAPACITY, dtype=np.int8)
+
+    def _attach_account(self, account: Account) -> None:
+        """Move the account's balance and rate into a new column row"""
+        balance = account.balance
+        rate = getattr(account, 'interest_rate', 0.0)
+        type_code = _TYPE_CODES[account.type_tag]
+        row = self._size
+        if np is None:
+            self._bal.append(balance)
+            self._rate.append(rate)
+            self._type.append(type_code)
+        else:
+            if row == len(self._bal):
+                # Double the capacity so appends stay amortized O(1)
+                capacity = 2 * row
+                self._bal = _grow_column(self._bal, capacity)
+                self._rate = _grow_column(self._rate, capacity)
+                self._type = _grow_column(self._type, capacity)
+            self._bal[row] = balance
+            self._rate[row] = rate
+            self._type[row] = type_code
+        self._size = row + 1
+        self._row[account.account_number] = row
+        account._attach(self, row)
+
+    def _load_data(self) -> None:
+        # Load customers
+        try:
+            with open(self._customer_file, 'rb') as f:
+                customer_data = _json_loads(f.read())
+            for cust_id, cust_dict in customer_data.items():
+                customer = Customer(cust_dict['customer_id'], cust_dict['name'], cust_dict['address'])
+                for acc_num in cust_dict.get('account_numbers', []):
+                    customer.add_account_number(sys.intern(acc_num))
+                self._customers[cust_id] = customer
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._customers = {}
+
+        # Load accounts
+        try:
+            with open(self._account_file, 'rb') as f:
+                # Streaming with ijson keeps peak memory down but parses about 2x slower
+                # than a whole-file load, so it is only worth it for very large files
+                if ijson is not None and os.fstat(f.fileno()).st_size >= self.STREAM_LOAD_BYTES:
+                    account_items = ijson.kvitems(f, '', use_float=True)
+                else:
+                    account_items = _json_loads(f.read()).items()
+                for acc_num, acc_dict in account_items:
+                    # Interned so every table keyed by account number shares one string object
+                    acc_num = sys.intern(acc_num)
+                    acc_type = acc_dict.get('type')
+                    if acc_type == 'savings':
+                        account = SavingsAccount(
+                            sys.intern(acc_dict['account_number']),
+                            acc_dict['account_holder_id'],
+                            acc_dict['balance'],
+                            acc_dict.get('interest_rate', 0.01)
+                        )
+                    elif acc_type == 'checking':
+                        account = CheckingAccount(
+                            sys.intern(acc_dict['account_number']),
+                            acc_dict['account_holder_id'],
+                            acc_dict['balance'],
+                            acc_dict.get('overdraft_limit', 0.0)
+                        )
+                    else:
+                        continue
+                    self._accounts[acc_num] = account
+                    self._attach_account(account)
+                    if acc_type == 'savings':
+                        self._savings_accounts.add(acc_num)
+        except _LOAD_ERRORS:
+            self._accounts = {}
+            self._savings_accounts = set()
+            self._reset_columns()
+
+        # Fix relationships
+        for customer in self._customers.values():
+            customer.retain_account_numbers(self._accounts.keys())
+
+    def _mark_dirty(self, customers: bool = False, accounts: bool = False) -> None:
+        self._dirty_customers |= customers
+        self._dirty_accounts |= accounts
+        if self._scheduler is None:
+            self.flush()
+        elif not self._save_scheduled:
+            self._save_scheduled = True
+            self._scheduler(self.SAVE_DELAY_MS, self.flush)
+
+    def flush(self) -> None:
+        """Write any pending changes to disk"""
+        self._save_scheduled = False
+        if self._dirty_customers:
+            self._save_customers()
+        if self._dirty_accounts:
+            self._save_accounts()
+
+    def _save_customers(self) -> None:
+        cust_dict = {cid: cust.to_dict() for cid, cust in self._customers.items()}
+        _write_atomic(self._customer_file, _json_dumps(cust_dict))
+        self._dirty_customers = False
+
+    def _save_accounts(self) -> None:
+        acc_dict = {acc_num: acc.to_dict() for acc_num, acc in self._accounts.items()}
+        _write_atomic(self._account_file, _json_dumps(acc_dict))
+        self._dirty_accounts = False
+
+    def clear_all_data(self) -> bool:
+        """Clear all customers and accounts data"""
+        # Clear in-memory data
+        for account in self._accounts.values():
+            account._detach()
+        self._customers = {}
+        self._accounts = {}
+        self._savings_accounts = set()
+        self._reset_columns()
+        self._dirty_customers = False
+        self._dirty_accounts = False
+        
+        # Delete data files
+        try:
+            if os.path.exists(self._customer_file):
+                os.remove(self._customer_file)
+            if os.path.exists(self._account_file):
+                os.remove(self._account_file)
+            return True
+        except Exception as e:
+            print(f"Error clearing data: {e}")
+            return False
+
+    def add_customer(self, customer: Customer) -> bool:
+        if customer.customer_id in self._customers:
+            return False
+        self._customers[customer.customer_id] = customer
+        self._mark_dirty(customers=True)
+        return True
+    
+    def remove_customer(self, customer_id: str) -> bool:
+        if customer_id not in self._customers:
+            return False
+        
+        customer = self._customers[customer_id]
+        if customer.account_count:
+            return False
+        
+        del self._customers[customer_id]
+        self._mark_dirty(customers=True)
+        return True
+    
+    def create_account(self, customer_id: str, account_type: str,
+                       initial_balance: float = 0.0, **kwargs) -> Account | None:
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return None
+
+        # Generate unique 12-digit account number
+        while True:
+            account_number = str(secrets.randbelow(900000000000) + 100000000000)
+            if account_number not in self._accounts:
+                break
+        account_number = sys.intern(account_number)
+
+        account = None
+        if account_type.lower() == 'savings':
+            interest_rate = kwargs.get('interest_rate', 0.01)
+            try:
+                account = SavingsAccount(account_number, customer_id, initial_balance, interest_rate)
+            except ValueError:
+                return None
+        elif account_type.lower() == 'checking':
+            overdraft_limit = kwargs.get('overdraft_limit', 0.0)
+            try:
+                account = CheckingAccount(account_number, customer_id, initial_balance, overdraft_limit)
+            except ValueError:
+                return None
+        else:
+            return None
+
+        self._accounts[account_number] = account
+        self._attach_account(account)
+        if account.type_tag == 'savings':
+            self._savings_accounts.add(account_number)
+        customer.add_account_number(account_number)
+        self._mark_dirty(customers=True, accounts=True)
+        return account
+
+    def deposit(self, account_number: str, amount: float) -> bool:
+        account = self._accounts.get(account_number)
+        if not account:
+            return False
+        result = account.deposit(amount)
+        if result:
+            self._mark_dirty(accounts=True)
+        return result
+
+    def withdraw(self, account_number: str, amount: float) -> bool:
+        account = self._accounts.get(account_number)
+        if not account:
+            return False
+        result = account.withdraw(amount)
+        if result:
+            self._mark_dirty(accounts=True)
+        return result
+
+    def transfer_funds(self, from_acc_num: str, to_acc_num: str, amount: float) -> bool:
+        from_account = self._accounts.get(from_acc_num)
+        to_account = self._accounts.get(to_acc_num)
+        if not from_account or not to_account:
+            return False
+        if amount <= 0:
+            return False
+
+        if not from_account.withdraw(amount):
+            return False
+        if not to_account.deposit(amount):
+            from_account.deposit(amount)
+            return False
+        self._mark_dirty(accounts=True)
+        return True
+
+    def get_account(self, account_number: str) -> Account | None:
+        return self._accounts.get(account_number)
+
+    def get_customer_accounts(self, customer_id: str) -> list[Account]:
+        customer = self._customers.get(customer_id)
+        if not customer:
+            return []
+        accounts = [self._accounts[acc_num] for acc_num in customer.account_numbers if acc_num in self._accounts]
+        # The numbers are a set, so sort for a stable order across runs
+        accounts.sort(key=lambda account: account.account_number)
+        return accounts
+
+    def get_all_customers(self) -> list[Customer]:
+        return list(self._customers.values())
+
+    def get_all_accounts(self) -> list[Account]:
+        return list(self._accounts.values())
+
+    def total_balance(self) -> float:
+        if np is None:
+            return sum(self._bal)
+        return float(self._bal[:self._size].sum())
+
+    def apply_all_interest(self) -> None:
+        if not self._savings_accounts:
+            return
+        if np is None:
+            # Work on row indices straight into the columns; the interned account
+            # numbers make each _row lookup an identity hit
+            bal, rate, rows = self._bal, self._rate, self._row
+            for acc_num in self._savings_accounts:
+                i = rows[acc_num]
+                bal[i] += bal[i] * rate[i]
+        else:
+            n = self._size
+            savings = self._type[:n] == _TYPE_CODES['savings']
+            bal = self._bal[:n]
+            bal[savings] += bal[savings] * self._rate[:n][savings]
+        self._mark_dirty(accounts=True)
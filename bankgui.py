@@ -1,380 +1,46 @@
-import json
-import random
-import os
-from abc import ABC, abstractmethod
+import itertools
 import tkinter as tk
 from tkinter import messagebox, ttk
 
+from bank_core import Bank, Customer
 
-# ======== Account Base Class ========
-class Account(ABC):
-    def __init__(self, account_number: str, account_holder_id: str, initial_balance: float = 0.0):
-        self._account_number = account_number
-        self._account_holder_id = account_holder_id
-        self._balance = initial_balance
 
-    @property
-    def account_number(self) -> str:
-        return self._account_number
-
-    @property
-    def balance(self) -> float:
-        return self._balance
-
-    @property
-    def account_holder_id(self) -> str:
-        return self._account_holder_id
-
-    @abstractmethod
-    def deposit(self, amount: float) -> bool:
-        pass
-
-    @abstractmethod
-    def withdraw(self, amount: float) -> bool:
-        pass
-
-    def display_details(self) -> str:
-        return f"Acc No: {self._account_number}, Balance: ${self._balance:.2f}"
-
-    def to_dict(self) -> dict:
-        return {
-            'account_number': self._account_number,
-            'account_holder_id': self._account_holder_id,
-            'balance': self._balance,
-            'type': 'account'
-        }
-
-
-# ======== SavingsAccount Class ========
-class SavingsAccount(Account):
-    def __init__(self, account_number: str, account_holder_id: str,
-                 initial_balance: float = 0.0, interest_rate: float = 0.01):
-        super().__init__(account_number, account_holder_id, initial_balance)
-        self._interest_rate = interest_rate if interest_rate >= 0 else 0.01
-
-    @property
-    def interest_rate(self) -> float:
-        return self._interest_rate
-
-    @interest_rate.setter
-    def interest_rate(self, value: float):
-        if value < 0:
-            raise ValueError("Interest rate cannot be negative.")
-        self._interest_rate = value
-
-    def deposit(self, amount: float) -> bool:
-        if amount <= 0:
-            return False
-        self._balance += amount
-        return True
-
-    def withdraw(self, amount: float) -> bool:
-        if amount <= 0 or amount > self._balance:
-            return False
-        self._balance -= amount
-        return True
-
-    def apply_interest(self) -> None:
-        self._balance += self._balance * self._interest_rate
-
-    def display_details(self) -> str:
-        base = super().display_details()
-        return f"{base}, Interest Rate: {self._interest_rate * 100:.2f}%"
-
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d.update({
-            'interest_rate': self._interest_rate,
-            'type': 'savings'
-        })
-        return d
-
-
-# ======== CheckingAccount Class ========
-class CheckingAccount(Account):
-    def __init__(self, account_number: str, account_holder_id: str,
-                 initial_balance: float = 0.0, overdraft_limit: float = 0.0):
-        super().__init__(account_number, account_holder_id, initial_balance)
-        self._overdraft_limit = overdraft_limit if overdraft_limit >= 0 else 0.0
-
-    @property
-    def overdraft_limit(self) -> float:
-        return self._overdraft_limit
-
-    @overdraft_limit.setter
-    def overdraft_limit(self, value: float):
-        if value < 0:
-            raise ValueError("Overdraft limit cannot be negative.")
-        self._overdraft_limit = value
-
-    def deposit(self, amount: float) -> bool:
-        if amount <= 0:
-            return False
-        self._balance += amount
-        return True
-
-    def withdraw(self, amount: float) -> bool:
-        if amount <= 0:
-            return False
-        if (self._balance - amount) < -self._overdraft_limit:
-            return False
-        self._balance -= amount
-        return True
-
-    def display_details(self) -> str:
-        base = super().display_details()
-        return f"{base}, Overdraft Limit: ${self._overdraft_limit:.2f}"
-
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d.update({
-            'overdraft_limit': self._overdraft_limit,
-            'type': 'checking'
-        })
-        return d
-# ======== Customer Class ========
-class Customer:
-    def __init__(self, customer_id: str, name: str, address: str):
-        self._customer_id = customer_id
-        self._name = name
-        self._address = address
-        self._account_numbers = []
-
-    @property
-    def customer_id(self) -> str:
-        return self._customer_id
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def address(self) -> str:
-        return self._address
-
-    @address.setter
-    def address(self, value: str):
-        self._address = value
-
-    @property
-    def account_numbers(self) -> list:
-        return list(self._account_numbers)
-
-    def add_account_number(self, account_number: str) -> None:
-        if account_number not in self._account_numbers:
-            self._account_numbers.append(account_number)
-
-    def remove_account_number(self, account_number: str) -> None:
-        if account_number in self._account_numbers:
-            self._account_numbers.remove(account_number)
-
-    def display_details(self) -> str:
-        return (f"Customer ID: {self._customer_id}, Name: {self._name}, Address: {self._address}, "
-                f"Accounts: {len(self._account_numbers)}")
-
-    def to_dict(self) -> dict:
-        return {
-            'customer_id': self._customer_id,
-            'name': self._name,
-            'address': self._address,
-            'account_numbers': self._account_numbers
-        }
-
-
-# ======== Bank Class ========
-class Bank:
-    def __init__(self, customer_file='customers.json', account_file='accounts.json'):
-        self._customers = {}
-        self._accounts = {}
-        self._customer_file = customer_file
-        self._account_file = account_file
-        self._load_data()
-
-    def _load_data(self) -> None:
-        # Load customers
-        try:
-            with open(self._customer_file, 'r') as f:
-                customer_data = json.load(f)
-            for cust_id, cust_dict in customer_data.items():
-                customer = Customer(cust_dict['customer_id'], cust_dict['name'], cust_dict['address'])
-                for acc_num in cust_dict.get('account_numbers', []):
-                    customer.add_account_number(acc_num)
-                self._customers[cust_id] = customer
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._customers = {}
-
-        # Load accounts
-        try:
-            with open(self._account_file, 'r') as f:
-                account_data = json.load(f)
-            for acc_num, acc_dict in account_data.items():
-                acc_type = acc_dict.get('type')
-                if acc_type == 'savings':
-                    account = SavingsAccount(
-                        acc_dict['account_number'],
-                        acc_dict['account_holder_id'],
-                        acc_dict['balance'],
-                        acc_dict.get('interest_rate', 0.01)
-                    )
-                elif acc_type == 'checking':
-                    account = CheckingAccount(
-                        acc_dict['account_number'],
-                        acc_dict['account_holder_id'],
-                        acc_dict['balance'],
-                        acc_dict.get('overdraft_limit', 0.0)
-                    )
-                else:
-                    continue
-                self._accounts[acc_num] = account
-        except (FileNotFoundError, json.JSONDecodeError):
-            self._accounts = {}
-
-        # Fix relationships
-        for customer in self._customers.values():
-            valid_accs = [acc for acc in customer.account_numbers if acc in self._accounts]
-            customer._account_numbers = valid_accs
-
-    def _save_data(self) -> None:
-        # Save customers
-        cust_dict = {cid: cust.to_dict() for cid, cust in self._customers.items()}
-        with open(self._customer_file, 'w') as f:
-            json.dump(cust_dict, f, indent=4)
-
-        # Save accounts
-        acc_dict = {acc_num: acc.to_dict() for acc_num, acc in self._accounts.items()}
-        with open(self._account_file, 'w') as f:
-            json.dump(acc_dict, f, indent=4)
-
-    def clear_all_data(self) -> bool:
-        """Clear all customers and accounts data"""
-        # Clear in-memory data
-        self._customers = {}
-        self._accounts = {}
-        
-        # Delete data files
-        try:
-            if os.path.exists(self._customer_file):
-                os.remove(self._customer_file)
-            if os.path.exists(self._account_file):
-                os.remove(self._account_file)
-            return True
-        except Exception as e:
-            print(f"Error clearing data: {e}")
-            return False
-
-    def add_customer(self, customer: Customer) -> bool:
-        if customer.customer_id in self._customers:
-            return False
-        self._customers[customer.customer_id] = customer
-        self._save_data()
-        return True
-    
-    def remove_customer(self, customer_id: str) -> bool:
-        if customer_id not in self._customers:
-            return False
-        
-        customer = self._customers[customer_id]
-        if customer.account_numbers:
-            return False
-        
-        del self._customers[customer_id]
-        self._save_data()
-        return True
-    
-    def create_account(self, customer_id: str, account_type: str,
-                       initial_balance: float = 0.0, **kwargs) -> Account | None:
-        customer = self._customers.get(customer_id)
-        if not customer:
-            return None
-
-        # Generate unique account number
-        account_number = str(random.randint(100000000000, 999999999999))
-
-        account = None
-        if account_type.lower() == 'savings':
-            interest_rate = kwargs.get('interest_rate', 0.01)
-            try:
-                account = SavingsAccount(account_number, customer_id, initial_balance, interest_rate)
-            except ValueError:
-                return None
-        elif account_type.lower() == 'checking':
-            overdraft_limit = kwargs.get('overdraft_limit', 0.0)
-            try:
-                account = CheckingAccount(account_number, customer_id, initial_balance, overdraft_limit)
-            except ValueError:
-                return None
-        else:
-            return None
-
-        self._accounts[account_number] = account
-        customer.add_account_number(account_number)
-        self._save_data()
-        return account
-
-    def deposit(self, account_number: str, amount: float) -> bool:
-        account = self._accounts.get(account_number)
-        if not account:
-            return False
-        result = account.deposit(amount)
-        if result:
-            self._save_data()
-        return result
-
-    def withdraw(self, account_number: str, amount: float) -> bool:
-        account = self._accounts.get(account_number)
-        if not account:
-            return False
-        result = account.withdraw(amount)
-        if result:
-            self._save_data()
-        return result
-
-    def transfer_funds(self, from_acc_num: str, to_acc_num: str, amount: float) -> bool:
-        from_account = self._accounts.get(from_acc_num)
-        to_account = self._accounts.get(to_acc_num)
-        if not from_account or not to_account:
-            return False
-        if amount <= 0:
-            return False
-
-        if not from_account.withdraw(amount):
-            return False
-        if not to_account.deposit(amount):
-            from_account.deposit(amount)
-            return False
-        self._save_data()
-        return True
-
-    def get_customer_accounts(self, customer_id: str) -> list[Account]:
-        customer = self._customers.get(customer_id)
-        if not customer:
-            return []
-        return [self._accounts[acc_num] for acc_num in customer.account_numbers if acc_num in self._accounts]
-
-    def get_all_customers(self) -> list[Customer]:
-        return list(self._customers.values())
-
-    def get_all_accounts(self) -> list[Account]:
-        return list(self._accounts.values())
-
-    def apply_all_interest(self) -> None:
-        changed = False
-        for account in self._accounts.values():
-            if isinstance(account, SavingsAccount):
-                account.apply_interest()
-                changed = True
-        if changed:
-            self._save_data()
+# ======== GUI Application ========
+# Account type tag -> (label, details formatter) for the accounts view
+_ACCOUNT_ROW_FMT = {
+    'savings': ("Savings", lambda a: f"Interest: {a.interest_rate * 100:.2f}%"),
+    'checking': ("Checking", lambda a: f"Overdraft: ${a.overdraft_limit:.2f}"),
+}
+
+
+def _account_rows(accounts) -> list[tuple]:
+    """Build the accounts view rows, one tuple per account"""
+    # Runs over a whole page at a time, so the lookups are bound to locals once
+    row_fmt = _ACCOUNT_ROW_FMT
+    rows = []
+    append = rows.append
+    for account in accounts:
+        acc_type, fmt_details = row_fmt[account.type_tag]
+        append((
+            account.account_number,
+            account.account_holder_id,
+            f"${account.balance:.2f}",
+            acc_type,
+            fmt_details(account)
+        ))
+    return rows
 
 
-# ======== GUI Application ========
 class BankingApp:
+    PAGE_SIZE = 100
+
     def __init__(self, root):
         self.root = root
         self.root.title("Banking System")
         self.root.geometry("800x600")
         
-        self.bank = Bank()
+        self.bank = Bank(scheduler=self.root.after)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Create notebook (tabs)
         self.notebook = ttk.Notebook(root)
@@ -443,10 +109,22 @@ class BankingApp:
         self.initial_balance_entry.grid(row=2, column=1, padx=5, pady=5)
         self.initial_balance_entry.insert(0, "0.0")
         
-        # Additional parameters frame
+        # Additional parameters frame, with one pre-built set of widgets per account type
         self.params_frame = ttk.Frame(account_frame)
         self.params_frame.grid(row=3, column=0, columnspan=2, pady=5)
         
+        self.savings_params_frame = ttk.Frame(self.params_frame)
+        ttk.Label(self.savings_params_frame, text="Interest Rate:").grid(row=0, column=0, sticky="e")
+        self.interest_rate_entry = ttk.Entry(self.savings_params_frame)
+        self.interest_rate_entry.grid(row=0, column=1, padx=5, pady=5)
+        self.interest_rate_entry.insert(0, "0.01")
+        
+        self.checking_params_frame = ttk.Frame(self.params_frame)
+        ttk.Label(self.checking_params_frame, text="Overdraft Limit:").grid(row=0, column=0, sticky="e")
+        self.overdraft_limit_entry = ttk.Entry(self.checking_params_frame)
+        self.overdraft_limit_entry.grid(row=0, column=1, padx=5, pady=5)
+        self.overdraft_limit_entry.insert(0, "0.0")
+        
         # Initially show savings account params
         self.show_account_params()
         
@@ -456,22 +134,16 @@ class BankingApp:
         ttk.Button(account_frame, text="Create Account", command=self.create_account).grid(row=4, column=0, columnspan=2, pady=10)
         
     def show_account_params(self, event=None):
-        # Clear params frame
-        for widget in self.params_frame.winfo_children():
-            widget.destroy()
+        # Hide both parameter sets, then show the one for the selected type
+        self.savings_params_frame.grid_remove()
+        self.checking_params_frame.grid_remove()
             
         account_type = self.account_type_var.get()
         
         if account_type == "Savings":
-            ttk.Label(self.params_frame, text="Interest Rate:").grid(row=0, column=0, sticky="e")
-            self.interest_rate_entry = ttk.Entry(self.params_frame)
-            self.interest_rate_entry.grid(row=0, column=1, padx=5, pady=5)
-            self.interest_rate_entry.insert(0, "0.01")
+            self.savings_params_frame.grid(row=0, column=0)
         elif account_type == "Checking":
-            ttk.Label(self.params_frame, text="Overdraft Limit:").grid(row=0, column=0, sticky="e")
-            self.overdraft_limit_entry = ttk.Entry(self.params_frame)
-            self.overdraft_limit_entry.grid(row=0, column=1, padx=5, pady=5)
-            self.overdraft_limit_entry.insert(0, "0.0")
+            self.checking_params_frame.grid(row=0, column=0)
         
     def create_transaction_tab(self):
         tab = ttk.Frame(self.notebook)
@@ -531,6 +203,9 @@ class BankingApp:
         cust_frame = ttk.LabelFrame(tab, text="Customers", padding=10)
         cust_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         
+        self.cust_search_var, self.cust_page_var, self.cust_page_spinbox = \
+            self.create_view_controls(cust_frame, self.refresh_customers)
+        
         self.cust_tree = ttk.Treeview(cust_frame, columns=("ID", "Name", "Address", "Accounts"), show="headings")
         self.cust_tree.heading("ID", text="Customer ID")
         self.cust_tree.heading("Name", text="Name")
@@ -548,6 +223,9 @@ class BankingApp:
         acc_frame = ttk.LabelFrame(tab, text="Accounts", padding=10)
         acc_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
         
+        self.acc_search_var, self.acc_page_var, self.acc_page_spinbox = \
+            self.create_view_controls(acc_frame, self.refresh_accounts)
+        
         self.acc_tree = ttk.Treeview(acc_frame, columns=("Number", "Holder", "Balance", "Type", "Details"), show="headings")
         self.acc_tree.heading("Number", text="Account No")
         self.acc_tree.heading("Holder", text="Holder ID")
@@ -567,6 +245,45 @@ class BankingApp:
         self.refresh_customers()
         self.refresh_accounts()
         
+    def create_view_controls(self, parent, refresh):
+        controls = ttk.Frame(parent)
+        controls.pack(fill="x", pady=(0, 5))
+        
+        search_var = tk.StringVar()
+        ttk.Label(controls, text="Search:").pack(side="left")
+        ttk.Entry(controls, textvariable=search_var).pack(side="left", padx=5)
+        
+        page_var = tk.StringVar(value="1")
+        ttk.Label(controls, text="Page:").pack(side="left")
+        page_spinbox = ttk.Spinbox(controls, from_=1, to=1, width=5, textvariable=page_var, command=refresh)
+        page_spinbox.pack(side="left", padx=5)
+        page_spinbox.bind("<Return>", lambda event: refresh())
+        
+        # A new search always starts from the first page
+        def on_search(*args):
+            page_var.set("1")
+            refresh()
+        search_var.trace_add("write", on_search)
+        
+        return search_var, page_var, page_spinbox
+        
+    def page_window(self, items, search_var, page_var, page_spinbox, search_key):
+        """Return the slice of items shown on the current page, after filtering"""
+        query = search_var.get().strip().lower()
+        if query:
+            items = [item for item in items if query in search_key(item).lower()]
+        
+        page_count = max(1, -(-len(items) // self.PAGE_SIZE))
+        page_spinbox.config(to=page_count)
+        try:
+            page = min(max(int(page_var.get()), 1), page_count)
+        except ValueError:
+            page = 1
+        page_var.set(str(page))
+        
+        start = (page - 1) * self.PAGE_SIZE
+        return itertools.islice(items, start, start + self.PAGE_SIZE)
+        
     def create_admin_tab(self):
         tab = ttk.Frame(self.notebook)
         self.notebook.add(tab, text="Admin")
@@ -585,6 +302,11 @@ class BankingApp:
         ttk.Button(clear_frame, text="Clear All Data", 
                   command=self.clear_data).pack(pady=10)
         
+    def on_close(self):
+        # Write out anything still waiting on the save timer
+        self.bank.flush()
+        self.root.destroy()
+        
     # ====== Business Logic Methods ======
     def add_customer(self):
         cust_id = self.cust_id_entry.get()
@@ -670,7 +392,7 @@ class BankingApp:
             messagebox.showinfo("Success", "Deposit successful!")
             self.deposit_acc_num_entry.delete(0, tk.END)
             self.deposit_amount_entry.delete(0, tk.END)
-            self.refresh_accounts()
+            self.update_account_rows(acc_num)
         else:
             messagebox.showerror("Error", "Deposit failed. Check account number and amount!")
             
@@ -687,7 +409,7 @@ class BankingApp:
             messagebox.showinfo("Success", "Withdrawal successful!")
             self.withdraw_acc_num_entry.delete(0, tk.END)
             self.withdraw_amount_entry.delete(0, tk.END)
-            self.refresh_accounts()
+            self.update_account_rows(acc_num)
         else:
             messagebox.showerror("Error", "Withdrawal failed. Check account number, amount, or available balance!")
             
@@ -706,7 +428,7 @@ class BankingApp:
             self.from_acc_num_entry.delete(0, tk.END)
             self.to_acc_num_entry.delete(0, tk.END)
             self.transfer_amount_entry.delete(0, tk.END)
-            self.refresh_accounts()
+            self.update_account_rows(from_acc, to_acc)
         else:
             messagebox.showerror("Error", "Transfer failed.Check account numbers and amount!")
             
@@ -726,39 +448,45 @@ class BankingApp:
                 
     def refresh_customers(self):
         # Clear existing data
-        for item in self.cust_tree.get_children():
-            self.cust_tree.delete(item)
+        self.cust_tree.delete(*self.cust_tree.get_children())
             
         # Add new data
-        for customer in self.bank.get_all_customers():
+        customers = self.page_window(
+            self.bank.get_all_customers(),
+            self.cust_search_var, self.cust_page_var, self.cust_page_spinbox,
+            lambda c: f"{c.customer_id} {c.name}"
+        )
+        for customer in customers:
             self.cust_tree.insert("", "end", values=(
                 customer.customer_id,
                 customer.name,
                 customer.address,
-                len(customer.account_numbers)
+                customer.account_count
             ))
             
     def refresh_accounts(self):
+        # Build rows before touching the widget
+        accounts = self.page_window(
+            self.bank.get_all_accounts(),
+            self.acc_search_var, self.acc_page_var, self.acc_page_spinbox,
+            lambda a: f"{a.account_number} {a.account_holder_id}"
+        )
+        rows = _account_rows(accounts)
+
         # Clear existing data
-        for item in self.acc_tree.get_children():
-            self.acc_tree.delete(item)
-            
-        # Add new data
-        for account in self.bank.get_all_accounts():
-            if isinstance(account, SavingsAccount):
-                acc_type = "Savings"
-                details = f"Interest: {account.interest_rate * 100:.2f}%"
-            else:
-                acc_type = "Checking"
-                details = f"Overdraft: ${account.overdraft_limit:.2f}"
-                
-            self.acc_tree.insert("", "end", values=(
-                account.account_number,
-                account.account_holder_id,
-                f"${account.balance:.2f}",
-                acc_type,
-                details
-            ))
+        self.acc_tree.delete(*self.acc_tree.get_children())
+
+        # Add new data, keyed by account number so rows can be updated in place
+        insert = self.acc_tree.insert
+        for values in rows:
+            insert("", "end", iid=values[0], values=values)
+        
+    def update_account_rows(self, *account_numbers):
+        """Refresh just the given accounts' rows; rows not on the current page are picked up by the next refresh"""
+        for acc_num in account_numbers:
+            account = self.bank.get_account(acc_num)
+            if account is not None and self.acc_tree.exists(acc_num):
+                self.acc_tree.item(acc_num, values=_account_rows((account,))[0])
 
 
 # ======== Main Application ========
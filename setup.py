@@ -0,0 +1,23 @@
+from setuptools import setup
+
+# Compiling the core with Cython is optional; without it the plain module is installed.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        "bank_core.py",
+        # annotation_typing=False keeps 'float' annotations from becoming C doubles,
+        # so compiled and pure-Python builds accept and store the same values
+        compiler_directives={'language_level': 3, 'boundscheck': False, 'wraparound': False,
+                             'annotation_typing': False},
+    )
+
+setup(
+    name="bnk-management-system",
+    version="0.1.0",
+    py_modules=["bank_core", "bankgui"],
+    ext_modules=ext_modules,
+    extras_require={'fast': ['orjson', 'numpy', 'ijson>=3.1']},
+)